@@ -420,15 +420,20 @@ class DebugTransform(OutputTransform):
             _cookies_to_xml(self.headers)
         ))
 
+        # join is a no-op for a single chunk; release the raw chunks as soon as they are encoded
+        # so that only the base64 copy is alive during the XSLT transformation below
         response_buffer = b''.join(self.chunks)
+        response_size = len(response_buffer)
         original_response = {
             'buffer': base64.b64encode(response_buffer),
             'headers': dict(self.headers),
             'code': int(self.status_code)
         }
+        del response_buffer
+        self.chunks = None
 
         debug_log_data.append(frontik.xml_util.dict_to_xml(original_response, 'original-response'))
-        debug_log_data.set('response-size', str(len(response_buffer)))
+        debug_log_data.set('response-size', str(response_size))
         debug_log_data.set('generate-time', _format_number((time.time() - start_time) * 1000))
 
         for upstream in debug_log_data.xpath('//meta-info/upstream'):
@@ -458,6 +463,8 @@ class DebugTransform(OutputTransform):
 
 
 class DebugMode:
+    __slots__ = ('mode_values', 'inherited', 'enabled', 'pass_debug', 'profile_xslt')
+
     def __init__(self, handler):
         debug_value = frontik.util.get_cookie_or_url_param_value(handler, 'debug')
 
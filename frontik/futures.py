@@ -1,7 +1,6 @@
 import asyncio
-import time
 import logging
-from functools import wraps, partial
+from functools import partial
 
 from tornado.ioloop import IOLoop
 from tornado.concurrent import Future
@@ -30,7 +29,6 @@ class AsyncGroup:
         self._finished = False
         self._name = name
         self._future = Future()
-        self._start_time = time.time()
         self._futures = []
 
     def is_finished(self):
@@ -78,7 +76,6 @@ class AsyncGroup:
     def add(self, intermediate_cb):
         self._inc()
 
-        @wraps(intermediate_cb)
         def new_cb(*args, **kwargs):
             if self._finished:
                 async_logger.info('ignoring executing callback in %s', self)
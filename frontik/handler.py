@@ -7,7 +7,7 @@ import math
 
 import asyncio
 from asyncio.futures import Future
-from functools import partial, wraps
+from functools import partial
 from typing import TYPE_CHECKING, Any, List, Type, Union, Awaitable
 
 import tornado.curl_httpclient
@@ -41,6 +41,10 @@ if TYPE_CHECKING:
     from http_client import BalancedHttpRequest
 
 
+def _noop():
+    pass
+
+
 def _fallback_status_code(status_code):
     return status_code if status_code in ALLOWED_STATUSES else http.client.SERVICE_UNAVAILABLE
 
@@ -71,6 +75,8 @@ class DefaultValueError(Exception):
 _ARG_DEFAULT = object()
 MEDIA_TYPE_PARAMETERS_SEPARATOR_RE = r' *; *'
 OUTER_TIMEOUT_MS_HEADER = 'X-Outer-Timeout-Ms'
+SERVER_HEADER_VALUE = f'Frontik/{frontik_version}'
+_NO_BODY_STATUSES = frozenset((http.client.NO_CONTENT, http.client.NOT_MODIFIED, *range(100, 200)))
 
 handler_logger = logging.getLogger('handler')
 
@@ -86,10 +92,70 @@ def _fail_fast_policy(fail_fast, waited, host, uri):
     return fail_fast
 
 
+def _page_method_dispatcher(page_method_name):
+    @gen.coroutine
+    def dispatcher(self, *args, **kwargs):
+        yield self._execute_page(getattr(self, page_method_name))
+
+    return dispatcher
+
+
+class _IOLoopMethod:
+    # handler instances use the IOLoop cached in __init__,
+    # calls on the class (e.g. PageHandler.add_callback(cb)) still go through IOLoop.current()
+    __slots__ = ('_name',)
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, handler, owner=None):
+        io_loop = IOLoop.current() if handler is None else handler._io_loop
+        return getattr(io_loop, self._name)
+
+
+class _FinishedGuard:
+    # returned by PageHandler.check_finished, a slotted instance is several times smaller than a closure with its cells
+    # and stays alive as long as the pending callback holding it
+    __slots__ = ('_handler', '_callback')
+
+    def __init__(self, handler, callback):
+        self._handler = handler
+        self._callback = callback
+
+    def __call__(self, *args, **kwargs):
+        if self._handler.is_finished():
+            self._handler.log.warning('page was already finished, %s ignored', self._callback)
+        else:
+            return self._callback(*args, **kwargs)
+
+
 class PageHandler(RequestHandler):
+    # RequestHandler instances still have __dict__, slots only cover attributes set by PageHandler itself
+    __slots__ = (
+        'name', 'request_id', 'config', 'log', 'text', 'stages_logger', 'timeout_checker',
+        'active_limit', 'debug_mode', 'finish_group', '_json_producer', '_xml_producer',
+        '_io_loop', '_launched_preprocessors', '_preprocessor_futures', '_exception_hooks', '_debug_access',
+        '_render_postprocessors', '_postprocessors', '_mandatory_cookies', '_mandatory_headers',
+        '_validation_model', '_handler_finished_notification', '_http_client_instance', '_json_body',
+    )
 
     preprocessors = ()
     _priority_preprocessor_names = []
+    _allowed_methods_header = 'get, post, put, delete'
+    _handler_repr = f'{__module__}.PageHandler'
+    _preprocessors_cache = {}
+    _default_generic_producer = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # preprocessors and their priorities are class attributes, so the resulting chain is the same for every request
+        cls._preprocessors_cache = {}
+        # plain text is produced without awaiting a coroutine unless _generic_producer is overridden
+        cls._default_generic_producer = cls._generic_producer is PageHandler._generic_producer
+        cls._handler_repr = f'{cls.__module__}.{cls.__name__}'
+        cls._allowed_methods_header = ', '.join(
+            name for name in ('get', 'post', 'put', 'delete') if f'{name}_page' in vars(cls)
+        )
 
     def __init__(self, application, request, **kwargs):
         self.name = self.__class__.__name__
@@ -97,12 +163,15 @@ class PageHandler(RequestHandler):
         self.config = application.config
         self.log = handler_logger
         self.text = None
+        self._io_loop = IOLoop.current()
+        self._json_producer = None
+        self._xml_producer = None
 
         super().__init__(application, request, **kwargs)
 
         self._launched_preprocessors = []
         self._preprocessor_futures = []
-        self._exception_hooks = []
+        self._exception_hooks = None
 
         for integration in application.available_integrations:
             integration.initialize_handler(self)
@@ -127,22 +196,12 @@ class PageHandler(RequestHandler):
                                                        request.request_time)
 
     def __repr__(self):
-        return '.'.join([self.__module__, self.__class__.__name__])
+        return self._handler_repr
 
     def prepare(self):
         self.active_limit = frontik.handler_active_limit.ActiveHandlersLimit(self.statsd_client)
         self.debug_mode = DebugMode(self)
-        self.finish_group = AsyncGroup(lambda: None, name='finish')
-
-        self.json_producer = self.application.json.get_producer(self)
-        self.json = self.json_producer.json
-
-        self.xml_producer = self.application.xml.get_producer(self)
-        self.doc = self.xml_producer.doc
-
-        self._http_client = self.application.http_client_factory.get_http_client(
-            self.modify_http_client_request, self.debug_mode.enabled
-        )  # type: HttpClient
+        self.finish_group = AsyncGroup(_noop, name='finish')
 
         self._handler_finished_notification = self.finish_group.add_notification()
 
@@ -161,10 +220,9 @@ class PageHandler(RequestHandler):
             self._debug_access = debug_access
 
     def set_default_headers(self):
-        self._headers = tornado.httputil.HTTPHeaders({
-            'Server': f'Frontik/{frontik_version}',
-            'X-Request-Id': self.request_id,
-        })
+        self._headers = tornado.httputil.HTTPHeaders()
+        self._headers['Server'] = SERVER_HEADER_VALUE
+        self._headers['X-Request-Id'] = self.request_id
 
     def decode_argument(self, value, name=None):
         try:
@@ -266,6 +324,58 @@ class PageHandler(RequestHandler):
     def reverse_url(self, name, *args, **kwargs):
         return self.application.reverse_url(name, *args, **kwargs)
 
+    # Producers are created on first use, plain text pages never need them
+
+    @property
+    def json_producer(self):
+        if self._json_producer is None:
+            self._json_producer = self.application.json.get_producer(self)
+        return self._json_producer
+
+    @json_producer.setter
+    def json_producer(self, json_producer):
+        self._json_producer = json_producer
+
+    @property
+    def json(self):
+        return self.json_producer.json
+
+    @json.setter
+    def json(self, json):
+        self.json_producer.json = json
+
+    @property
+    def xml_producer(self):
+        if self._xml_producer is None:
+            self._xml_producer = self.application.xml.get_producer(self)
+        return self._xml_producer
+
+    @xml_producer.setter
+    def xml_producer(self, xml_producer):
+        self._xml_producer = xml_producer
+
+    @property
+    def doc(self):
+        return self.xml_producer.doc
+
+    @doc.setter
+    def doc(self, doc):
+        self.xml_producer.doc = doc
+
+    @property
+    def _http_client(self) -> HttpClient:
+        # curl handles and connections are shared on the application level,
+        # the per-request client is only needed by handlers which actually make requests
+        if not hasattr(self, '_http_client_instance'):
+            self._http_client_instance = self.application.http_client_factory.get_http_client(
+                self.modify_http_client_request, self.debug_mode.enabled
+            )
+        return self._http_client_instance
+
+    @_http_client.setter
+    def _http_client(self, http_client):
+        self._http_client_instance = http_client
+
     @property
     def json_body(self):
         if not hasattr(self, '_json_body'):
@@ -278,48 +388,22 @@ class PageHandler(RequestHandler):
         except json.JSONDecodeError as _:
             raise JSONBodyParseError()
 
-    @classmethod
-    def add_callback(cls, callback, *args, **kwargs):
-        IOLoop.current().add_callback(callback, *args, **kwargs)
-
-    @classmethod
-    def add_timeout(cls, deadline, callback, *args, **kwargs):
-        return IOLoop.current().add_timeout(deadline, callback, *args, **kwargs)
-
-    @staticmethod
-    def remove_timeout(timeout):
-        IOLoop.current().remove_timeout(timeout)
-
-    @classmethod
-    def add_future(cls, future, callback):
-        IOLoop.current().add_future(future, callback)
+    add_callback = _IOLoopMethod('add_callback')
+    add_timeout = _IOLoopMethod('add_timeout')
+    remove_timeout = _IOLoopMethod('remove_timeout')
+    add_future = _IOLoopMethod('add_future')
 
     # Requests handling
 
     def _execute(self, transforms, *args, **kwargs):
-        request_context.set_handler_name(repr(self))
+        request_context.set_handler_name(self._handler_repr)
         with stack_context.ExceptionStackContext(self._stack_context_handle_exception):
             return super()._execute(transforms, *args, **kwargs)
 
-    @gen.coroutine
-    def get(self, *args, **kwargs):
-        yield self._execute_page(self.get_page)
-
-    @gen.coroutine
-    def post(self, *args, **kwargs):
-        yield self._execute_page(self.post_page)
-
-    @gen.coroutine
-    def head(self, *args, **kwargs):
-        yield self._execute_page(self.get_page)
-
-    @gen.coroutine
-    def delete(self, *args, **kwargs):
-        yield self._execute_page(self.delete_page)
-
-    @gen.coroutine
-    def put(self, *args, **kwargs):
-        yield self._execute_page(self.put_page)
+    get = head = _page_method_dispatcher('get_page')
+    post = _page_method_dispatcher('post_page')
+    put = _page_method_dispatcher('put_page')
+    delete = _page_method_dispatcher('delete_page')
 
     def options(self, *args, **kwargs):
         self.__return_405()
@@ -327,17 +411,7 @@ class PageHandler(RequestHandler):
     @gen.coroutine
     def _execute_page(self, page_handler_method):
         self.stages_logger.commit_stage('prepare')
-        preprocessors = _get_preprocessors(page_handler_method.__func__)
-
-        def _prioritise_preprocessor_by_list(preprocessor):
-            name = _get_preprocessor_name(preprocessor)
-            if name in self._priority_preprocessor_names:
-                return self._priority_preprocessor_names.index(name)
-            else:
-                return math.inf
-
-        preprocessors.sort(key=_prioritise_preprocessor_by_list)
-        preprocessors_to_run = _unwrap_preprocessors(self.preprocessors) + preprocessors
+        preprocessors_to_run = self._get_page_method_preprocessors(page_handler_method)
         preprocessors_completed = yield self._run_preprocessors(preprocessors_to_run)
 
         if not preprocessors_completed:
@@ -353,6 +427,32 @@ class PageHandler(RequestHandler):
         if render_result is not None:
             self.write(render_result)
 
+    def _get_page_method_preprocessors(self, page_handler_method):
+        page_function = page_handler_method.__func__
+        preprocessors = self._preprocessors_cache.get(page_function)
+
+        if preprocessors is None:
+            page_preprocessors = _get_preprocessors(page_function)
+            if self._priority_preprocessor_names:
+                page_preprocessors = sorted(page_preprocessors, key=self._get_preprocessor_priority)
+
+            preprocessors = _unwrap_preprocessors(self.preprocessors) + page_preprocessors
+            preprocessors = tuple(self._wrap_preprocessor_function(p) for p in preprocessors)
+            self._preprocessors_cache[page_function] = preprocessors
+
+        return preprocessors
+
+    @staticmethod
+    def _wrap_preprocessor_function(preprocessor_function):
+        return gen.coroutine(preprocessor_function)
+
+    def _get_preprocessor_priority(self, preprocessor):
+        name = _get_preprocessor_name(preprocessor)
+        if name in self._priority_preprocessor_names:
+            return self._priority_preprocessor_names.index(name)
+        else:
+            return math.inf
+
     def get_page(self):
         """ This method can be implemented in the subclass """
         self.__return_405()
@@ -370,10 +470,7 @@ class PageHandler(RequestHandler):
         self.__return_405()
 
     def __return_405(self):
-        allowed_methods = [
-            name for name in ('get', 'post', 'put', 'delete') if f'{name}_page' in vars(self.__class__)
-        ]
-        self.set_header('Allow', ', '.join(allowed_methods))
+        self.set_header('Allow', self._allowed_methods_header)
         self.set_status(405)
         self.finish()
 
@@ -398,14 +495,7 @@ class PageHandler(RequestHandler):
         return self._finished
 
     def check_finished(self, callback):
-        @wraps(callback)
-        def wrapper(*args, **kwargs):
-            if self.is_finished():
-                self.log.warning('page was already finished, %s ignored', callback)
-            else:
-                return callback(*args, **kwargs)
-
-        return wrapper
+        return _FinishedGuard(self, callback)
 
     def finish_with_postprocessors(self):
         if not self.finish_group.get_finish_future().done():
@@ -430,15 +520,18 @@ class PageHandler(RequestHandler):
             self.log.info('page was already finished, skipping page producer')
             return
 
-        if self.text is not None:
-            renderer = self._generic_producer
-        elif not self.json.is_empty():
-            renderer = self.json_producer
+        if self.text is not None and self._default_generic_producer:
+            rendered_result, meta_info = self._produce_plaintext()
         else:
-            renderer = self.xml_producer
+            if self.text is not None:
+                renderer = self._generic_producer
+            elif self._json_producer is not None and not self.json.is_empty():
+                renderer = self.json_producer
+            else:
+                renderer = self.xml_producer
 
-        self.log.debug('using %s renderer', renderer)
-        rendered_result, meta_info = yield renderer()
+            self.log.debug('using %s renderer', renderer)
+            rendered_result, meta_info = yield renderer()
 
         postprocessed_result = yield self._run_template_postprocessors(self._render_postprocessors,
                                                                        rendered_result, meta_info)
@@ -461,13 +554,17 @@ class PageHandler(RequestHandler):
         Adds a function to the list of hooks, which are executed when `log_exception` is called.
         `exception_hook` must have the same signature as `log_exception`
         """
+        if self._exception_hooks is None:
+            self._exception_hooks = []
+
         self._exception_hooks.append(exception_hook)
 
     def log_exception(self, typ, value, tb):
         super().log_exception(typ, value, tb)
 
-        for exception_hook in self._exception_hooks:
-            exception_hook(typ, value, tb)
+        if self._exception_hooks is not None:
+            for exception_hook in self._exception_hooks:
+                exception_hook(typ, value, tb)
 
     def _handle_request_exception(self, e):
         if isinstance(e, AbortAsyncGroup):
@@ -563,8 +660,7 @@ class PageHandler(RequestHandler):
 
     def finish(self, chunk=None):
         self.stages_logger.commit_stage('postprocess')
-        for name, value in self._mandatory_headers.items():
-            self.set_header(name, value)
+        self._headers.update(self._mandatory_headers)
 
         for args, kwargs in self._mandatory_cookies.values():
             try:
@@ -572,7 +668,7 @@ class PageHandler(RequestHandler):
             except ValueError:
                 self.set_status(http.client.BAD_REQUEST)
 
-        if self._status_code in (204, 304) or (100 <= self._status_code < 200):
+        if self._status_code in _NO_BODY_STATUSES:
             self._write_buffer = []
             chunk = None
 
@@ -591,7 +687,8 @@ class PageHandler(RequestHandler):
         return future
 
     def set_mandatory_header(self, name, value):
-        self._mandatory_headers[name] = value
+        # values are validated here, so finish() can copy them without going through set_header
+        self._mandatory_headers[name] = self._convert_header_value(value)
 
     def set_mandatory_cookie(self, name, value, domain=None, expires=None, path="/", expires_days=None, **kwargs):
         self._mandatory_cookies[name] = ((name, value, domain, expires, path, expires_days), kwargs)
@@ -626,11 +723,13 @@ class PageHandler(RequestHandler):
     @gen.coroutine
     def _run_preprocessors(self, preprocessor_functions):
         for p in preprocessor_functions:
-            yield self._run_preprocessor_function(p)
+            yield p(self)
+            self._launched_preprocessors.append(_get_preprocessor_name(p))
             if self._finished:
                 self.log.info('page was already finished, breaking preprocessors chain')
                 return False
-        yield gen.multi(self._preprocessor_futures)
+        if self._preprocessor_futures:
+            yield gen.multi(self._preprocessor_futures)
 
         self._preprocessor_futures = None
 
@@ -671,6 +770,9 @@ class PageHandler(RequestHandler):
     # Producers
 
     async def _generic_producer(self):
+        return self._produce_plaintext()
+
+    def _produce_plaintext(self):
         self.log.debug('finishing plaintext')
 
         if self._headers.get('Content-Type') is None:
@@ -864,17 +966,7 @@ class AwaitablePageHandler(PageHandler):
 
     async def _execute_page(self, page_handler_method):
         self.stages_logger.commit_stage('prepare')
-        preprocessors = _get_preprocessors(page_handler_method.__func__)
-
-        def _prioritise_preprocessor_by_list(preprocessor):
-            name = _get_preprocessor_name(preprocessor)
-            if name in self._priority_preprocessor_names:
-                return self._priority_preprocessor_names.index(name)
-            else:
-                return math.inf
-
-        preprocessors.sort(key=_prioritise_preprocessor_by_list)
-        preprocessors_to_run = _unwrap_preprocessors(self.preprocessors) + preprocessors
+        preprocessors_to_run = self._get_page_method_preprocessors(page_handler_method)
         preprocessors_completed = await self._run_preprocessors(preprocessors_to_run)
 
         if not preprocessors_completed:
@@ -953,15 +1045,18 @@ class AwaitablePageHandler(PageHandler):
             self.log.info('page was already finished, skipping page producer')
             return
 
-        if self.text is not None:
-            renderer = self._generic_producer
-        elif not self.json.is_empty():
-            renderer = self.json_producer
+        if self.text is not None and self._default_generic_producer:
+            rendered_result, meta_info = self._produce_plaintext()
         else:
-            renderer = self.xml_producer
+            if self.text is not None:
+                renderer = self._generic_producer
+            elif self._json_producer is not None and not self.json.is_empty():
+                renderer = self.json_producer
+            else:
+                renderer = self.xml_producer
 
-        self.log.debug('using %s renderer', renderer)
-        rendered_result, meta_info = await renderer()
+            self.log.debug('using %s renderer', renderer)
+            rendered_result, meta_info = await renderer()
 
         postprocessed_result = await self._run_template_postprocessors(
             self._render_postprocessors,
@@ -972,6 +1067,10 @@ class AwaitablePageHandler(PageHandler):
 
     # Preprocessors and postprocessors
 
+    @staticmethod
+    def _wrap_preprocessor_function(preprocessor_function):
+        return preprocessor_function
+
     async def _run_preprocessor_function(self, preprocessor_function):
         await preprocessor_function(self)
         self._launched_preprocessors.append(
@@ -986,11 +1085,13 @@ class AwaitablePageHandler(PageHandler):
 
     async def _run_preprocessors(self, preprocessor_functions):
         for p in preprocessor_functions:
-            await self._run_preprocessor_function(p)
+            await p(self)
+            self._launched_preprocessors.append(_get_preprocessor_name(p))
             if self._finished:
                 self.log.info('page was already finished, breaking preprocessors chain')
                 return False
-        await asyncio.gather(*self._preprocessor_futures)
+        if self._preprocessor_futures:
+            await asyncio.gather(*self._preprocessor_futures)
 
         self._preprocessor_futures = None
 
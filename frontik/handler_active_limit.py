@@ -7,6 +7,8 @@ handlers_count_logger = logging.getLogger('handlers_count')
 
 
 class ActiveHandlersLimit:
+    __slots__ = ('_acquired', '_statsd_client', '_high_watermark')
+
     count = 0
     high_watermark_ratio = 0.75
 
@@ -8,6 +8,8 @@ stages_logger = logging.getLogger('stages')
 
 
 class StagesLogger:
+    __slots__ = ('_last_stage_time', '_start_time', '_stages', '_statsd_client')
+
     Stage = namedtuple('Stage', ('name', 'delta', 'start_delta'))
 
     def __init__(self, request, statsd_client):
@@ -33,13 +35,16 @@ class StagesLogger:
 
         self._statsd_client.stack()
 
+        stages_parts = []
+        total = 0
         for s in self._stages:
-            self._statsd_client.time(f'handler.stage.time', int(s.delta), stage=s.name)
+            self._statsd_client.time('handler.stage.time', int(s.delta), stage=s.name)
+            stages_parts.append(f'{s.name}={s.delta:.2f}')
+            total += s.delta
 
         self._statsd_client.flush()
 
-        stages_str = ' '.join(f'{s.name}={s.delta:.2f}' for s in self._stages)
-        total = sum(s.delta for s in self._stages)
+        stages_str = ' '.join(stages_parts)
 
         stages_logger.info(
             'timings for %(page)s : %(stages)s',
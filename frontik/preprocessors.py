@@ -36,19 +36,16 @@ def preprocessor(function_or_list):
     """
 
     def preprocessor_decorator(func):
-        if callable(function_or_list):
-            _register_preprocessors(func, [function_or_list])
-        else:
-            for dep in reversed(function_or_list):
-                dep(func)
-
+        _register_preprocessors(func, preprocessor_decorator._preprocessor_chain)
         return func
 
     if callable(function_or_list):
         dep_name = function_or_list.__name__
         preprocessor_decorator.preprocessor_name = _get_preprocessor_name(function_or_list)
         preprocessor_decorator.function = function_or_list
+        preprocessor_decorator._preprocessor_chain = (function_or_list,)
     else:
+        preprocessor_decorator._preprocessor_chain = tuple(_unwrap_preprocessors(function_or_list))
         dep_name = [f.__name__ for f in function_or_list]
     preprocessor_decorator.func_name = f'preprocessor_decorator({dep_name})'
 
@@ -60,11 +57,21 @@ def _get_preprocessors(func):
 
 
 def _unwrap_preprocessors(preprocessors):
-    return _get_preprocessors(preprocessor(preprocessors)(lambda: None))
+    unwrapped = []
+    for dep in preprocessors:
+        if not callable(dep):
+            raise TypeError(f'{dep!r} is not a preprocessor')
+
+        chain = getattr(dep, '_preprocessor_chain', None)
+        if chain is None:
+            chain = _get_preprocessors(dep(lambda: None))
+        unwrapped.extend(chain)
+
+    return unwrapped
 
 
 def _register_preprocessors(func, preprocessors):
-    setattr(func, '_preprocessors', preprocessors + _get_preprocessors(func))
+    setattr(func, '_preprocessors', list(preprocessors) + _get_preprocessors(func))
 
 
 def make_preprocessors_names_list(preprocessors_list):
@@ -31,8 +31,10 @@ def fork_workers(worker_function, *, init_workers_count_down, num_workers, after
 
         state.terminating = True
         before_workers_shutdown_action()
-        for pid, id in state.children.items():
-            log.info('sending %s to child %d (pid %d)', signal.Signals(signum).name, id, pid)
+
+        children = list(state.children)
+        log.info('sending %s to %d children (pids %s)', signal.Signals(signum).name, len(children), children)
+        for pid in children:
             os.kill(pid, signal.SIGTERM)
 
     signal.signal(signal.SIGTERM, sigterm_handler)
@@ -66,32 +68,64 @@ def _supervise_workers(state, worker_function):
                 continue
             raise
 
-        if pid not in state.children:
-            continue
+        exited_children = [(pid, status)]
+        exited_children.extend(_reap_exited_children())
 
-        id = state.children.pop(pid)
-        if os.WIFSIGNALED(status):
-            log.warning("child %d (pid %d) killed by signal %d, restarting", id, pid, os.WTERMSIG(status))
-        elif os.WEXITSTATUS(status) != 0:
-            log.warning("child %d (pid %d) exited with status %d, restarting", id, pid, os.WEXITSTATUS(status))
-        else:
-            log.info("child %d (pid %d) exited normally", id, pid)
-            continue
+        for pid, status in exited_children:
+            is_worker = _handle_child_exit(pid, status, state)
+            if is_worker:
+                worker_function()
+                return
+    log.info('all children terminated, exiting')
+    sys.exit(0)
 
-        if state.terminating:
-            log.info("server is shutting down, not restarting %d", id)
-            continue
 
-        is_worker = _start_child(id, state)
-        if is_worker:
-            worker_function()
+def _reap_exited_children():
+    # on shutdown all workers exit at once, collect them without going back to a blocking wait for each one
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
             return
-    log.info('all children terminated, exiting')
-    sys.exit(0)
+        except OSError as e:
+            if errno_from_exception(e) == errno.EINTR:
+                continue
+            raise
+
+        if pid == 0:
+            return
+
+        yield pid, status
+
+
+def _handle_child_exit(pid, status, state):
+    # returns True inside restarted child process, otherwise False
+    if pid not in state.children:
+        return False
+
+    id = state.children.pop(pid)
+    if os.WIFSIGNALED(status):
+        log.warning("child %d (pid %d) killed by signal %d, restarting", id, pid, os.WTERMSIG(status))
+    elif os.WEXITSTATUS(status) != 0:
+        log.warning("child %d (pid %d) exited with status %d, restarting", id, pid, os.WEXITSTATUS(status))
+    else:
+        log.info("child %d (pid %d) exited normally", id, pid)
+        return False
+
+    if state.terminating:
+        log.info("server is shutting down, not restarting %d", id)
+        return False
+
+    return _start_child(id, state)
 
 
 def _start_child(i, state):
     # returns True inside child process, therwise False
+    # objects allocated by supervisor after initial freeze (e.g. before restarting a worker)
+    # must not be scanned by collections in child, otherwise copy-on-write pages get unshared;
+    # collect first so supervisor garbage is not moved to the permanent generation on every restart
+    gc.collect()
+    gc.freeze()
     pid = os.fork()
     if pid == 0:
         state.server = False
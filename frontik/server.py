@@ -214,16 +214,18 @@ async def _deinit_app(app: FrontikApplication, ioloop: BaseAsyncIOLoop, need_to_
 
 def wrap_handle_with_time_logging(handle: Type[asyncio.Handle], app: FrontikApplication, slow_tasks_logger):
     old_run = handle._run
+    threshold_sec = options.asyncio_task_threshold_sec
+    critical_threshold_sec = options.asyncio_task_critical_threshold_sec
 
     def run(self):
         start_time = self._loop.time()
         old_run(self)
         delta = self._loop.time() - start_time
-        if delta >= options.asyncio_task_threshold_sec:
+        if delta >= threshold_sec:
             delta_ms = delta * 1000
             app.statsd_client.time('long_task.time', int(delta_ms))
             slow_tasks_logger.warning('%s took %.2fms', self, delta_ms)
-        if options.asyncio_task_critical_threshold_sec and delta >= options.asyncio_task_critical_threshold_sec:
+        if critical_threshold_sec and delta >= critical_threshold_sec:
             request = get_request() or HTTPServerRequest('GET', '/asyncio_long_task_stub')
             sentry_logger = app.get_sentry_logger(request)
             sentry_logger.update_user_info(ip='127.0.0.1')
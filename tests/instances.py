@@ -1,10 +1,12 @@
 import base64
+import http.cookiejar
 import json
 import socket
 import subprocess
 import sys
 import time
 from distutils.spawn import find_executable
+from functools import lru_cache
 
 import requests
 from frontik import options
@@ -19,15 +21,12 @@ except ImportError:
 
 
 def _run_command(command, port):
-    python = sys.executable
+    args = [sys.executable]
 
     if USE_COVERAGE:
-        coverage = find_executable('coverage')
-        executable = f'{python} {coverage} run {command} --port={port}'
-    else:
-        executable = f'{python} {command} --port={port}'
+        args += [find_executable('coverage'), 'run']
 
-    return subprocess.Popen(executable.split())
+    return subprocess.Popen([*args, *command.split(), f'--port={port}'])
 
 
 def find_free_port(from_port=9000, to_port=10000):
@@ -46,6 +45,7 @@ def find_free_port(from_port=9000, to_port=10000):
     return port
 
 
+@lru_cache(maxsize=64)
 def create_basic_auth_header(credentials):
     return 'Basic {}'.format(to_unicode(base64.b64encode(utf8(credentials))))
 
@@ -58,6 +58,10 @@ class FrontikTestInstance:
         self.popen = None
         self.port = None
 
+        # keep-alive connections to the instance, response cookies must not leak between tests
+        self.session = requests.Session()
+        self.session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
     def start(self):
         if self.port:
             return
@@ -86,9 +90,10 @@ class FrontikTestInstance:
 
         self.popen.terminate()
         self.popen.wait(300)
+        self.session.close()
         self.port = None
 
-    def get_page(self, page, notpl=False, method=requests.get, **kwargs):
+    def get_page(self, page, notpl=False, method=None, **kwargs):
         if not self.port:
             self.start()
 
@@ -106,9 +111,12 @@ class FrontikTestInstance:
 
         kwargs['timeout'] = 1
 
+        if method is None:
+            method = self.session.get
+
         return method(url, **kwargs)
 
-    def get_page_xml(self, page, notpl=False, method=requests.get, **kwargs):
+    def get_page_xml(self, page, notpl=False, method=None, **kwargs):
         content = utf8(self.get_page(page, notpl=notpl, method=method, **kwargs).content)
 
         try:
@@ -116,7 +124,7 @@ class FrontikTestInstance:
         except Exception as e:
             raise Exception(f'failed to parse xml ({e}): "{content}"')
 
-    def get_page_json(self, page, notpl=False, method=requests.get, **kwargs):
+    def get_page_json(self, page, notpl=False, method=None, **kwargs):
         content = self.get_page_text(page, notpl=notpl, method=method, **kwargs)
 
         try:
@@ -124,7 +132,7 @@ class FrontikTestInstance:
         except Exception as e:
             raise Exception(f'failed to parse json ({e}): "{content}"')
 
-    def get_page_text(self, page, notpl=False, method=requests.get, **kwargs):
+    def get_page_text(self, page, notpl=False, method=None, **kwargs):
         return to_unicode(self.get_page(page, notpl=notpl, method=method, **kwargs).content)
 
 
@@ -136,6 +144,14 @@ frontik_consul_mock_app = FrontikTestInstance(
 )
 frontik_consul_mock_app.start()
 
+
+def reset_consul_mock_counters():
+    # only apps started by consul registration tests run with consul_enabled,
+    # so clearing the mock's call counters gives each of those tests a clean mock
+    frontik_consul_mock_app.get_page('call_registration_stat', method=requests.delete)
+    frontik_consul_mock_app.get_page('call_deregistration_stat', method=requests.delete)
+
+
 frontik_test_app = FrontikTestInstance(
     './frontik-test --app=tests.projects.test_app '
     f' --config=tests/projects/frontik_debug.cfg {common_frontik_start_options} '
@@ -7,3 +7,6 @@ class Page(PageHandler):
     def get_page(self):
         self.set_status(200)
         self.text = json.dumps(self.application.registration_call_counter)
+
+    def delete_page(self):
+        self.application.registration_call_counter.clear()
@@ -2,6 +2,7 @@ import json
 import logging
 import re
 import tornado.routing
+from tornado.concurrent import Future
 
 from frontik.app import FrontikApplication
 from frontik.loggers import bootstrap_logger
@@ -41,6 +42,7 @@ class TestKafkaProducer:
     def __init__(self):
         self.data = []
         self.request_id = None
+        self.data_future = None
 
     async def send(self, topic, value=None):
         json_data = json.loads(value)
@@ -50,8 +52,15 @@ class TestKafkaProducer:
                 topic: json_data
             })
 
+            if not self.data_future.done():
+                self.data_future.set_result(None)
+
     def enable_for_request_id(self, request_id):
         self.request_id = request_id
+        self.data_future = Future()
+
+    def wait_for_data(self):
+        return self.data_future
 
     def disable_and_get_data(self):
         self.request_id = None
@@ -0,0 +1,10 @@
+from frontik.handler import PageHandler
+
+
+class Page(PageHandler):
+    def get_page(self):
+        self.text = 'text'
+
+    async def _generic_producer(self):
+        body, meta_info = await super()._generic_producer()
+        return f'async {body}', meta_info
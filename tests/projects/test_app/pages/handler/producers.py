@@ -0,0 +1,18 @@
+from frontik.handler import PageHandler
+from frontik.json_builder import JsonBuilder
+
+
+class Page(PageHandler):
+    def get_page(self):
+        self.text = 'text'
+        self.add_render_postprocessor(self._producers_pp)
+
+    @staticmethod
+    def _producers_pp(handler, text, meta_info):
+        if handler._json_producer is None and handler._xml_producer is None:
+            return f'{text}, producers not created'
+        return f'{text}, producers created'
+
+    def post_page(self):
+        self.json = JsonBuilder()
+        self.json.put({'assigned': True})
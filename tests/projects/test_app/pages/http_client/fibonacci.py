@@ -1,5 +1,4 @@
 from frontik import media_types
-from frontik.futures import AsyncGroup
 from frontik.handler import PageHandler
 
 
@@ -13,14 +12,10 @@ class Page(PageHandler):
             self.text = '1'
             return
 
-        self.acc = 0
+        host, path = self.request.host, self.request.path
+        first, second = yield [
+            self.get_url(host, path, data={'n': str(n - 1)}),
+            self.get_url(host, path, data={'n': str(n - 2)})
+        ]
 
-        def intermediate_cb(text, response):
-            self.acc += int(text)
-
-        def final_cb():
-            self.text = str(self.acc)
-
-        grp = AsyncGroup(final_cb, name='acc')
-        self.get_url(self.request.host, self.request.path, data={'n': str(n - 1)}, callback=grp.add(intermediate_cb))
-        self.get_url(self.request.host, self.request.path, data={'n': str(n - 2)}, callback=grp.add(intermediate_cb))
+        self.text = str(int(first.data) + int(second.data))
@@ -1,4 +1,5 @@
-import time
+import asyncio
+from datetime import timedelta
 
 from tornado.concurrent import Future
 
@@ -6,16 +7,20 @@ from frontik.handler import PageHandler
 from frontik.preprocessors import preprocessor
 
 
+async def _put_to_completed(handler, sleep_time_sec, preprocessor_name):
+    await asyncio.sleep(sleep_time_sec)
+    completed_preprocessors = getattr(handler, 'completed_preprocessors', None)
+    if completed_preprocessors is None:
+        completed_preprocessors = handler.completed_preprocessors = []
+
+    completed_preprocessors.append(preprocessor_name)
+    return preprocessor_name
+
+
 def waiting_preprocessor(sleep_time_sec, preprocessor_name, add_preprocessor_future):
     @preprocessor
     def pp(handler):
-        def _put_to_completed():
-            handler.completed_preprocessors = getattr(handler, 'completed_preprocessors', [])
-            handler.completed_preprocessors.append(preprocessor_name)
-            wait_future.set_result(preprocessor_name)
-
-        wait_future = Future()
-        handler.add_timeout(time.time() + sleep_time_sec, _put_to_completed)
+        wait_future = asyncio.ensure_future(_put_to_completed(handler, sleep_time_sec, preprocessor_name))
 
         if add_preprocessor_future:
             handler.add_preprocessor_future(wait_future)
@@ -27,7 +32,7 @@ def waiting_preprocessor(sleep_time_sec, preprocessor_name, add_preprocessor_fut
 def pp_1(handler):
     def _done(_):
         handler.add_timeout(
-            time.time() + 0.2, handler.finish_group.add(lambda: handler.add_preprocessor_future(Future()))
+            timedelta(seconds=0.05), handler.finish_group.add(lambda: handler.add_preprocessor_future(Future()))
         )
 
     future = Future()
@@ -38,14 +43,14 @@ def pp_1(handler):
 
 class Page(PageHandler):
 
-    @waiting_preprocessor(0.7, "should_finish_after_page_finish", False)
-    @waiting_preprocessor(0.5, "should_finish_third", True)
-    @waiting_preprocessor(0.1, "should_finish_first", False)
-    @waiting_preprocessor(0.3, "should_finish_second", True)
-    @waiting_preprocessor(0.9, "should_finish_after_page_finish", False)
+    @waiting_preprocessor(0.5, "should_finish_after_page_finish", False)
+    @waiting_preprocessor(0.35, "should_finish_third", True)
+    @waiting_preprocessor(0.05, "should_finish_first", False)
+    @waiting_preprocessor(0.2, "should_finish_second", True)
+    @waiting_preprocessor(0.65, "should_finish_after_page_finish", False)
     def get_page(self):
         assert hasattr(self, 'completed_preprocessors')
-        self.json.put({'preprocessors': self.completed_preprocessors})
+        self.json.put({'preprocessors': list(self.completed_preprocessors)})
 
     @pp_1
     def post_page(self):
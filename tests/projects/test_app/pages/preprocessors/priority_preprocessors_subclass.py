@@ -0,0 +1,19 @@
+from frontik.preprocessors import _get_preprocessors, make_preprocessors_names_list
+
+from tests.projects.test_app.pages.preprocessors import priority_preprocessors
+
+
+def _put_declared_preprocessors(handler):
+    handler.json.put({
+        'declared': [p.__name__ for p in _get_preprocessors(priority_preprocessors.Page.get_page)],
+    })
+
+
+class Page(priority_preprocessors.Page):
+    _priority_preprocessor_names = make_preprocessors_names_list([
+        priority_preprocessors.pp3, priority_preprocessors.pp1
+    ])
+
+    def prepare(self):
+        super().prepare()
+        self.add_postprocessor(_put_declared_preprocessors)
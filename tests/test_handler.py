@@ -19,6 +19,18 @@ class TestHandler(unittest.TestCase):
         text = frontik_test_app.get_page_text('handler/check_finished')
         self.assertEqual(text, 'Callback not called')
 
+    def test_async_generic_producer_override(self):
+        text = frontik_test_app.get_page_text('handler/async_generic_producer')
+        self.assertEqual(text, 'async text')
+
+    def test_text_page_does_not_create_producers(self):
+        text = frontik_test_app.get_page_text('handler/producers')
+        self.assertEqual(text, 'text, producers not created')
+
+    def test_assign_json(self):
+        json = frontik_test_app.get_page_json('handler/producers', method=requests.post)
+        self.assertEqual(json, {'assigned': True})
+
     def test_head(self):
         response = frontik_test_app.get_page('handler/head', method=requests.head)
         self.assertEqual(response.headers['X-Foo'], 'Bar')
@@ -3,9 +3,51 @@ import unittest
 
 import requests
 
+from frontik.preprocessors import _get_preprocessors, _unwrap_preprocessors, preprocessor
 from .instances import frontik_test_app
 
 
+def _pp_a(handler):
+    pass
+
+
+def _pp_b(handler):
+    pass
+
+
+def _pp_c(handler):
+    pass
+
+
+class TestPreprocessorDecorators(unittest.TestCase):
+    def test_list_is_flattened(self):
+        pp_a, pp_b, pp_c = preprocessor(_pp_a), preprocessor(_pp_b), preprocessor(_pp_c)
+
+        self.assertEqual(_unwrap_preprocessors([pp_a, preprocessor([pp_b, pp_c])]), [_pp_a, _pp_b, _pp_c])
+
+        @preprocessor([pp_a, pp_b])
+        @pp_c
+        def get_page(handler):
+            pass
+
+        self.assertEqual(_get_preprocessors(get_page), [_pp_a, _pp_b, _pp_c])
+
+    def test_nested_decorator_chain_is_not_rewritten(self):
+        pp_a, pp_b = preprocessor(_pp_a), preprocessor(_pp_b)
+        inner = preprocessor([pp_a])
+        pp_b(inner)
+
+        self.assertEqual(_unwrap_preprocessors([inner]), [_pp_a])
+        self.assertEqual(_unwrap_preprocessors([preprocessor([inner, pp_b])]), [_pp_a, _pp_b])
+
+    def test_not_callable_preprocessor(self):
+        with self.assertRaises(TypeError):
+            preprocessor([preprocessor(_pp_a), 'not a preprocessor'])
+
+        with self.assertRaises(TypeError):
+            _unwrap_preprocessors([None])
+
+
 class TestPreprocessors(unittest.TestCase):
     def test_preprocessors(self):
         response_json = frontik_test_app.get_page_json('preprocessors')
@@ -55,6 +97,18 @@ class TestPreprocessors(unittest.TestCase):
             }
         )
 
+    def test_priority_preprocessors_are_cached_per_class(self):
+        for _ in range(2):
+            response_json = frontik_test_app.get_page_json('preprocessors/priority_preprocessors')
+            self.assertEqual(response_json['order'], ['pp0', 'pp2', 'pp1', 'pp3'])
+
+        response_json = frontik_test_app.get_page_json('preprocessors/priority_preprocessors_subclass')
+        self.assertEqual(response_json['order'], ['pp0', 'pp3', 'pp1', 'pp2'])
+        self.assertEqual(response_json['declared'], ['pp1', 'pp3', 'pp2'])
+
+        response_json = frontik_test_app.get_page_json('preprocessors/priority_preprocessors')
+        self.assertEqual(response_json['order'], ['pp0', 'pp2', 'pp1', 'pp3'])
+
     def test_add_preprocessor_future_after_preprocessors(self):
         response = frontik_test_app.get_page('preprocessors/preprocessor_futures', method=requests.post)
         self.assertEqual(response.status_code, 500)
@@ -1,15 +1,15 @@
 import unittest
 
-from .instances import FrontikTestInstance, common_frontik_start_options
+from .instances import (
+    FrontikTestInstance, common_frontik_start_options, frontik_consul_mock_app, reset_consul_mock_counters,
+)
 
 
 class ServiceDiscoveryTestCase(unittest.TestCase):
 
     def setUp(self):
-        self.consul_mock = FrontikTestInstance(
-            f'./frontik-test --app=tests.projects.consul_mock_app {common_frontik_start_options} '
-            ' --config=tests/projects/frontik_consul_mock.cfg')
-        self.consul_mock.start()
+        reset_consul_mock_counters()
+        self.consul_mock = frontik_consul_mock_app
         self.frontik_single_worker_app = FrontikTestInstance(
             f'./frontik-test --app=tests.projects.no_debug_app {common_frontik_start_options} '
             f' --config=tests/projects/frontik_no_debug.cfg --consul_port={self.consul_mock.port} '
@@ -22,7 +22,6 @@ class ServiceDiscoveryTestCase(unittest.TestCase):
     def tearDown(self):
         self.frontik_single_worker_app.stop()
         self.frontik_multiple_worker_app.stop()
-        self.consul_mock.stop()
 
     def test_single_worker_de_registration(self):
         self.frontik_single_worker_app.start()